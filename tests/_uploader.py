@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+from typing import List
+from types import ModuleType
+
+
+def import_script_as_module(module_name: str, paths_to_try: List[str]) -> ModuleType:
+    """
+    Imports a Python script as a module, whether it ends in ".py" or not.
+    Given the name of a module to import, and a list of absolute or relative path names
+    (including the filename), import the module.  The module is set up so that it can
+    later be imported, but a reference to the module is also returned.
+
+    If the module has already been imported, the existing module is returned
+    rather than loading the script again.
+
+    Args:
+        module_name (str): The name of the module to import.
+                This doesn't have to match the filename.
+        paths_to_try (List[str]): A list of file paths to look for the file to load.
+                This can be absolute or relative paths to the file, the first file that
+                exists is used.
+
+    Returns:
+        Module: A reference to the imported module.
+
+    Raises:
+        FileNotFoundError: If the module file is not found in any of the specified directory paths.
+        ImportError: If there are issues importing the module, such as invalid Python syntax in the module file.
+
+    Example:
+        my_module = import_script_as_module("my_module", ["my_module", "../my_module"])
+
+        # Now you can either directly use "my_module"
+        my_module.function()
+
+        # Or you can later import it:
+        import my_module
+    """
+    import sys
+
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    import os
+
+    for try_filename in paths_to_try:
+        try:
+            os.stat(try_filename)
+        except FileNotFoundError:
+            continue
+        #  abspath() rather than resolve(), there's no need to walk symlinks for __file__
+        module_filename = os.path.abspath(try_filename)
+        break
+    else:
+        raise FileNotFoundError(f"Unable to find '{module_name}' module to import")
+
+    from importlib.util import spec_from_file_location, module_from_spec
+    from importlib.machinery import SourceFileLoader
+
+    #  An explicit loader is required, the script has no ".py" suffix to pick one from
+    spec = spec_from_file_location(
+        module_name,
+        module_filename,
+        loader=SourceFileLoader(module_name, module_filename),
+    )
+    if spec is None:
+        raise ImportError(
+            "Unable to spec_from_file_location() the module, no error returned."
+        )
+    module = module_from_spec(spec)
+    #  register before executing, as the import system does, so the script can import itself
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+
+    return module
+
+
+up = import_script_as_module("up", ["./up", "../up"])
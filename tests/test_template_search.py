@@ -1,66 +1,6 @@
 #!/usr/bin/env python3
 
-from typing import List
-from types import ModuleType
-
-
-def import_script_as_module(module_name: str, paths_to_try: List[str]) -> ModuleType:
-    """
-    Imports a Python script as a module, whether it ends in ".py" or not.
-    Given the name of a module to import, and a list of absolute or relative path names
-    (including the filename), import the module.  The module is set up so that it can
-    later be imported, but a reference to the module is also returned.
-
-    Args:
-        module_name (str): The name of the module to import.
-                This doesn't have to match the filename.
-        paths_to_try (List[str]): A list of file paths to look for the file to load.
-                This can be absolute or relative paths to the file, the first file that
-                exists is used.
-
-    Returns:
-        Module: A reference to the imported module.
-
-    Raises:
-        FileNotFoundError: If the module file is not found in any of the specified directory paths.
-        ImportError: If there are issues importing the module, such as invalid Python syntax in the module file.
-
-    Example:
-        my_module = import_script_as_module("my_module", ["my_module", "../my_module"])
-
-        # Now you can either directly use "my_module"
-        my_module.function()
-
-        # Or you can later import it:
-        import my_module
-    """
-    from pathlib import Path
-    import os
-
-    for try_filename in paths_to_try:
-        if os.path.exists(try_filename):
-            module_filename = Path(try_filename).resolve()
-            break
-    else:
-        raise FileNotFoundError(f"Unable to find '{module_name}' module to import")
-
-    from importlib.util import spec_from_loader, module_from_spec
-    from importlib.machinery import SourceFileLoader
-    import sys
-
-    spec = spec_from_loader(
-        module_name, SourceFileLoader(module_name, str(module_filename))
-    )
-    if spec is None:
-        raise ImportError("Unable to spec_from_loader() the module, no error returned.")
-    module = module_from_spec(spec)
-    spec.loader.exec_module(module)
-    sys.modules["up"] = module
-
-    return module
-
-
-up = import_script_as_module("up", ["./up", "../up"])
+from _uploader import up
 
 import unittest
 import tempfile
@@ -70,17 +10,27 @@ import os
 
 
 class TestTemplateSearch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.test_dir = Path(tempfile.mkdtemp())
+        os.makedirs(cls.test_dir.joinpath("files"))
+        cls.test_dir.joinpath("topdir.j2").write_text("Placeholder")
+        cls.test_dir.joinpath("files").joinpath("subdir.j2").write_text("Placeholder")
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.test_dir)
+
     def setUp(self):
-        self.test_dir = Path(tempfile.mkdtemp())
-        print(f" *** Test dir: {self.test_dir}")
-        os.mkdir(self.test_dir.joinpath("files"))
-        with open(self.test_dir.joinpath("topdir.j2"), "w") as fp:
-            fp.write("Placeholder")
-        with open(self.test_dir.joinpath("files").joinpath("subdir.j2"), "w") as fp:
-            fp.write("Placeholder")
+        self._orig_env = os.environ.get("UP_FILES_PATH")
+        self.addCleanup(self._restore_env)
+        os.environ.pop("UP_FILES_PATH", None)
 
-    def tearDown(self):
-        shutil.rmtree(self.test_dir)
+    def _restore_env(self):
+        if self._orig_env is None:
+            os.environ.pop("UP_FILES_PATH", None)
+        else:
+            os.environ["UP_FILES_PATH"] = self._orig_env
 
     def test_template_search(self):
         cmd = up.CommandProcessor(self.test_dir.joinpath("up.yml").parent, "up.yml")
@@ -125,3 +75,30 @@ class TestTemplateSearch(unittest.TestCase):
             assert cmd.find_file("subdir.j2") == self.test_dir.joinpath(
                 "files"
             ).joinpath("subdir.j2")
+
+    def test_template_search_refresh_env(self):
+        cmd = up.CommandProcessor(self.test_dir.joinpath("up.yml").parent, "up.yml")
+        os.environ["UP_FILES_PATH"] = ".../files"
+        assert cmd.find_file("topdir.j2") == self.test_dir.joinpath("topdir.j2")
+        cmd.refresh_env()
+        assert cmd.files_search_path == ".../files"
+        with self.assertRaises(FileNotFoundError):
+            cmd.find_file("topdir.j2")
+
+    def test_template_search_files_change(self):
+        #  uses its own tree, the class-wide test_dir is shared and must not change
+        test_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, test_dir)
+        os.makedirs(test_dir.joinpath("files"))
+        cmd = up.CommandProcessor(test_dir.joinpath("up.yml").parent, "up.yml")
+        subdir_file = test_dir.joinpath("files").joinpath("changing.j2")
+        topdir_file = test_dir.joinpath("changing.j2")
+        subdir_file.write_text("Placeholder")
+
+        assert cmd.find_file("changing.j2") == subdir_file
+        topdir_file.write_text("Placeholder")
+        assert cmd.find_file("changing.j2") == topdir_file
+        topdir_file.unlink()
+        subdir_file.unlink()
+        with self.assertRaises(FileNotFoundError):
+            cmd.find_file("changing.j2")